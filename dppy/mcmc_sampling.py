@@ -12,10 +12,17 @@
 """
 
 import time
+from concurrent.futures import ProcessPoolExecutor
+
 import numpy as np
 import scipy.linalg as la
 
-from dppy.utils import det_ST, check_random_state
+from dppy.utils import logdet_ST, check_random_state
+
+try:  # Compiled inner loops, used when numba is installed (see setup.py)
+    from dppy.mcmc_sampling_core import add_delete_core, basis_exchange_core
+except ImportError:
+    add_delete_core, basis_exchange_core = None, None
 
 
 ############################################
@@ -63,6 +70,62 @@ def dpp_sampler_mcmc(kernel, mode='AED', **params):
     return sampl
 
 
+def dpp_sampler_mcmc_parallel(kernel, mode='AED', nb_chains=2,
+                              max_workers=None, **params):
+    """ Run ``nb_chains`` independent copies of :func:`dpp_sampler_mcmc <dpp_sampler_mcmc>` in parallel worker processes.
+
+    The MCMC samplers are embarrassingly parallel across independent chains:
+    each chain is seeded with a distinct seed spawned from ``random_state``
+    and run in its own process, giving near-linear speedup up to the number
+    of cores with no algorithmic change.
+
+    :param kernel:
+        Kernel martrix
+    :type kernel:
+        array_like
+
+    :param mode:
+        MCMC mode passed to :func:`dpp_sampler_mcmc <dpp_sampler_mcmc>`,
+        among ``'AED'``, ``'AD'`` and ``'E'``. Default is ``'AED'``.
+    :type mode:
+        string
+
+    :param nb_chains:
+        Number of independent chains to run. Default is 2.
+    :type nb_chains:
+        int
+
+    :param max_workers:
+        Maximum number of worker processes,
+        see :class:`concurrent.futures.ProcessPoolExecutor`.
+        Default is None i.e. the number of processors of the machine.
+    :type max_workers:
+        int
+
+    :param params:
+        Extra parameters forwarded to
+        :func:`dpp_sampler_mcmc <dpp_sampler_mcmc>`.
+
+    :return:
+        list of ``nb_chains`` MCMC chains.
+    :rtype:
+        list
+
+    .. seealso::
+
+        - :func:`dpp_sampler_mcmc <dpp_sampler_mcmc>`
+    """
+    rng = check_random_state(params.pop('random_state', None))
+    seeds = rng.randint(2**31 - 1, size=nb_chains)
+
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        chains = [executor.submit(dpp_sampler_mcmc, kernel, mode,
+                                  random_state=int(seed), **params)
+                  for seed in seeds]
+
+        return [chain.result() for chain in chains]
+
+
 def initialize_AED_sampler(kernel, random_state=None):
     """
     .. seealso::
@@ -76,24 +139,20 @@ def initialize_AED_sampler(kernel, random_state=None):
     N = kernel.shape[0]
     ground_set = np.arange(N)
 
-    S0, det_S0 = [], 0.0
     nb_trials = 100
     tol = 1e-9
 
     for _ in range(nb_trials):
-        if det_S0 > tol:
-            break
-        else:
-            T = rng.choice(2 * N, size=N, replace=False)
-            S0 = np.intersect1d(T, ground_set, assume_unique=True)
-            det_S0 = det_ST(kernel, S0)
-    else:
-        err_str = ['Initialization terminated unsuccessfully.',
-                   'After {} random trials, no initial set S0 satisfies det L_S0 > {}.'.format(nb_trials, tol),
-                   'You may consider passing your own initial state **{"s_init": S0}.']
-        raise ValueError('\n'.join(err_str))
+        T = rng.choice(2 * N, size=N, replace=False)
+        S0 = np.intersect1d(T, ground_set, assume_unique=True)
+        sign, logdet_S0 = np.linalg.slogdet(kernel[np.ix_(S0, S0)])
+        if sign > 0 and logdet_S0 > np.log(tol):
+            return S0.tolist()
 
-    return S0.tolist()
+    err_str = ['Initialization terminated unsuccessfully.',
+               'After {} random trials, no initial set S0 satisfies det L_S0 > {}.'.format(nb_trials, tol),
+               'You may consider passing your own initial state **{"s_init": S0}.']
+    raise ValueError('\n'.join(err_str))
 
 
 def initialize_AD_and_E_sampler(kernel, size=None, random_state=None):
@@ -109,26 +168,94 @@ def initialize_AD_and_E_sampler(kernel, size=None, random_state=None):
 
     N = kernel.shape[0]
 
-    S0, det_S0 = [], 0.0
     nb_trials = 100
     tol = 1e-9
 
-    for _ in range(nb_trials):
-        if det_S0 > tol:
-            break
-        else:
-            S0 = rng.choice(N,
-                            size=size if size else rng.randint(1, N + 1),
-                            replace=False)
-            det_S0 = det_ST(kernel, S0)
+    if size:
+        # Candidates share a common size: batch the determinants with the
+        # gufunc np.linalg.slogdet on a 3D stack of submatrices, by small
+        # chunks to allow an early exit once a valid candidate is found
+        chunk = 10
+        for _ in range(0, nb_trials, chunk):
+            candidates = np.array([rng.choice(N, size=size, replace=False)
+                                   for _ in range(chunk)])
+            K_cand = kernel[candidates[:, :, None], candidates[:, None, :]]
+            signs, logdets = np.linalg.slogdet(K_cand)
+            valid = np.flatnonzero((signs > 0) & (logdets > np.log(tol)))
+            if valid.size:
+                return candidates[valid[0]].tolist()
     else:
-        err_str = ['Initialization terminated unsuccessfully.',
-                   'After {} random trials, no initial set S0 satisfies det L_S0 > {}.'.format(nb_trials, tol),
-                   'If you are sampling from a k-DPP, make sure k <= rank(L).' if size else '',
-                   'You may consider passing your own initial state **{"s_init": S0}.']
-        raise ValueError('\n'.join(err_str))
+        # Candidate sizes are random, evaluate them sequentially
+        for _ in range(nb_trials):
+            S0 = rng.choice(N, size=rng.randint(1, N + 1), replace=False)
+            sign, logdet_S0 = np.linalg.slogdet(kernel[np.ix_(S0, S0)])
+            if sign > 0 and logdet_S0 > np.log(tol):
+                return S0.tolist()
+
+    err_str = ['Initialization terminated unsuccessfully.',
+               'After {} random trials, no initial set S0 satisfies det L_S0 > {}.'.format(nb_trials, tol),
+               'If you are sampling from a k-DPP, make sure k <= rank(L).' if size else '',
+               'You may consider passing your own initial state **{"s_init": S0}.']
+    raise ValueError('\n'.join(err_str))
+
+
+def check_s_init(s_init, N):
+    """ Check that the initial sample ``s_init`` only contains valid indices of the ground set :math:`\\{0, \\dots, N-1\\}`.
+
+    :param s_init:
+        Initial sample.
+    :type s_init:
+        list
+
+    :param N:
+        Number of elements of the ground set.
+    :type N:
+        int
+    """
+    if s_init is not None and len(s_init)\
+            and not (0 <= min(s_init) and max(s_init) < N):
+        raise ValueError('Invalid s_init: indices must lie in [0, N-1]={}, given {}'.format([0, N - 1], list(s_init)))
+
+
+def schur_complement_add(kernel, K_S_inv, S, t):
+    """ Compute the Schur complement :math:`K_{tt} - K_{tS} K_S^{-1} K_{St}`, which equals the ratio :math:`\\det K_{S+t} / \\det K_S` by the matrix determinant lemma.
+
+    :return:
+        tuple (schur, w) where ``w = K_S_inv.dot(kernel[S, t])`` is reused by
+        :func:`update_inverse_add <update_inverse_add>`
+    :rtype:
+        tuple(float, array_like)
+    """
+    b = kernel[S, t]
+    w = K_S_inv.dot(b)
+
+    return kernel[t, t] - b.dot(w), w
+
+
+def update_inverse_add(K_S_inv, w, schur):
+    """ Compute :math:`K_{S+t}^{-1}` from :math:`K_S^{-1}` via the block inverse formula, item :math:`t` being appended last, in :math:`O(|S|^2)`.
+
+    .. seealso::
+
+        - :func:`schur_complement_add <schur_complement_add>`
+    """
+    size = K_S_inv.shape[0]
+
+    K_S1_inv = np.empty((size + 1, size + 1))
+    K_S1_inv[:size, :size] = K_S_inv + np.outer(w, w) / schur
+    K_S1_inv[:size, size] = K_S1_inv[size, :size] = -w / schur
+    K_S1_inv[size, size] = 1.0 / schur
+
+    return K_S1_inv
+
+
+def update_inverse_delete(K_S_inv, ind):
+    """ Compute :math:`K_{S-s}^{-1}` from :math:`K_S^{-1}` via a Sherman-Morrison type downdate, :math:`s` sitting at position ``ind`` in :math:`S`, in :math:`O(|S|^2)`.
+    """
+    sub = np.delete(np.delete(K_S_inv, ind, axis=0), ind, axis=1)
+    u = np.delete(K_S_inv[ind], ind)
 
-    return S0.tolist()
+    return sub - np.outer(u, u) / K_S_inv[ind, ind]
 
 
 def add_exchange_delete_sampler(kernel, s_init=None, nb_iter=10, T_max=None,
@@ -172,66 +299,116 @@ def add_exchange_delete_sampler(kernel, s_init=None, nb_iter=10, T_max=None,
     rng = check_random_state(random_state)
 
     # Initialization
+    # Store the kernel as a C-contiguous float64 array once at entry, so
+    # that all downstream linear algebra works on a known dtype/layout
+    kernel = np.ascontiguousarray(kernel, dtype=np.float64)
     N = kernel.shape[0]
-    ground_set = np.arange(N)
-
-    S0, det_S0 = s_init, det_ST(kernel, s_init)
-    size_S0 = len(S0)  # Size of the current sample
-    chain = [S0]  # Initialize the collection (list) of sample
+    check_s_init(s_init, N)
+
+    # Work in log scale: Cholesky based log det is ~2x cheaper than the LU
+    # factorization behind np.linalg.det and cannot over/underflow
+    logdet_S0 = logdet_ST(kernel, s_init)
+    size_S0 = len(s_init)  # Size of the current sample
+    chain = [list(s_init)]  # Initialize the collection (list) of sample
+
+    # Current sample S_arr[:size_S0], stored in a preallocated int array
+    # with a size counter: each proposal S1 differs from S0 by at most one
+    # in-place write, rolled back on rejection, instead of copying a list
+    S_arr = np.empty(N + 1, dtype=np.int64)
+    S_arr[:size_S0] = s_init
+
+    # Indicator of S0, to draw t in [N]-S0 by rejection in O(1) expected
+    # time instead of materializing the whole complement with np.delete
+    in_S0 = np.zeros(N, dtype=bool)
+    in_S0[S_arr[:size_S0]] = True
+
+    # Pre-draw the per-iteration randomness in 2 vectorized calls: cheaper
+    # than scalar RNG calls (and their 1-element array allocations) per
+    # iteration. Draws with a state-dependent range (s_ind, t) stay inside
+    # the loop as scalar randint, avoiding the general rng.choice path
+    unif_U = rng.rand(nb_iter)  # move type selector
+    log_unif_accept = np.log(rng.rand(nb_iter))  # accept/reject threshold
+
+    def move_thresholds(size):
+        # Move type selected by U < thr_add / thr_exch / thr_del, else stay.
+        # The thresholds only depend on ratio = size / N, so they are
+        # recomputed as 3 plain floats when an accepted move changes the
+        # sample size, instead of being re-derived at every iteration
+        ratio = size / N  # Proportion of items in current sample
+        return (0.5 * (1 - ratio)**2,
+                0.5 * (1 - ratio),
+                0.5 * (ratio**2 + (1 - ratio)))
+
+    thr_add, thr_exch, thr_del = move_thresholds(size_S0)
 
     # Evaluate running time...
     t_start = time.time() if T_max else 0
 
-    for _ in range(1, nb_iter):
+    for it in range(1, nb_iter):
 
-        S1 = S0.copy()  # S1 = S0
         # Pick one element s in S_0 by index uniformly at random
-        s_ind = rng.choice(size_S0 if size_S0 else N)  # , size=1)[0]
-        # Unif t in [N]-S0
-        t = rng.choice(np.delete(ground_set, S0))
+        s_ind = rng.randint(size_S0 if size_S0 else N)
+        # Unif t in [N]-S0, acceptance proba 1 - size_S0/N per draw
+        if size_S0 < N:
+            t = rng.randint(N)
+            while in_S0[t]:
+                t = rng.randint(N)
+        else:
+            t = -1  # complement is empty, only delete/stay moves can occur
 
-        U = rng.rand()
-        ratio = size_S0 / N  # Proportion of items in current sample
+        U = unif_U[it]
 
         # Add: S1 = S0 + t
-        if U < 0.5 * (1 - ratio)**2:
-            S1.append(t)  # S1 = S0 + t
+        if U < thr_add:
+            S_arr[size_S0] = t  # S1 = S0 + t, appended last
             # Accept_reject the move
-            det_S1 = det_ST(kernel, S1)  # det K_S1
-            if rng.rand() < det_S1 / det_S0 * (size_S0 + 1) / (N - size_S0):
-                S0, det_S0 = S1, det_S1
-                chain.append(S1)
+            logdet_S1 = logdet_ST(kernel, S_arr[:size_S0 + 1])
+            if log_unif_accept[it] < logdet_S1 - logdet_S0\
+                    + np.log((size_S0 + 1) / (N - size_S0)):
+                logdet_S0 = logdet_S1
+                in_S0[t] = True
                 size_S0 += 1
+                thr_add, thr_exch, thr_del = move_thresholds(size_S0)
+                chain.append(S_arr[:size_S0].tolist())
             else:
-                chain.append(S0)
+                chain.append(chain[-1])
 
         # Exchange: S1 = S0 - s + t
-        elif (0.5 * (1 - ratio)**2 <= U) & (U < 0.5 * (1 - ratio)):
-            del S1[s_ind]  # S1 = S0 - s
-            S1.append(t)  # S1 = S1 + t = S0 - s + t
+        elif U < thr_exch:
+            s = S_arr[s_ind]
+            S_arr[s_ind] = t  # S1 = S0 - s + t, t taking the slot of s
             # Accept_reject the move
-            det_S1 = det_ST(kernel, S1)  # det K_S1
-            if rng.rand() < (det_S1 / det_S0):
-                S0, det_S0 = S1, det_S1
-                chain.append(S1)
+            logdet_S1 = logdet_ST(kernel, S_arr[:size_S0])
+            if log_unif_accept[it] < logdet_S1 - logdet_S0:
+                logdet_S0 = logdet_S1
+                in_S0[s] = False
+                in_S0[t] = True
                 # size_S0 stays the same
+                chain.append(S_arr[:size_S0].tolist())
             else:
-                chain.append(S0)
+                S_arr[s_ind] = s  # roll back
+                chain.append(chain[-1])
 
         # Delete: S1 = S0 - s
-        elif (0.5 * (1 - ratio) <= U) & (U < 0.5 * (ratio**2 + (1 - ratio))):
-            del S1[s_ind]  # S0 - s
+        elif U < thr_del:
+            s = S_arr[s_ind]
+            # S1 = S0 - s, swap-remove: order within S_arr is irrelevant
+            S_arr[s_ind] = S_arr[size_S0 - 1]
             # Accept_reject the move
-            det_S1 = det_ST(kernel, S1)  # det K_S1
-            if rng.rand() < det_S1 / det_S0 * size_S0 / (N - (size_S0 - 1)):
-                S0, det_S0 = S1, det_S1
-                chain.append(S1)
+            logdet_S1 = logdet_ST(kernel, S_arr[:size_S0 - 1])
+            if log_unif_accept[it] < logdet_S1 - logdet_S0\
+                    + np.log((N - size_S0 + 1) / size_S0):
+                logdet_S0 = logdet_S1
+                in_S0[s] = False
                 size_S0 -= 1
+                thr_add, thr_exch, thr_del = move_thresholds(size_S0)
+                chain.append(S_arr[:size_S0].tolist())
             else:
-                chain.append(S0)
+                S_arr[s_ind] = s  # roll back
+                chain.append(chain[-1])
 
         else:
-            chain.append(S0)
+            chain.append(chain[-1])
 
         if T_max:
             if time.time() - t_start < T_max:
@@ -282,39 +459,126 @@ def add_delete_sampler(kernel, s_init, nb_iter=10, T_max=None,
     rng = check_random_state(random_state)
 
     # Initialization
+    # Store the kernel as a C-contiguous float64 array once at entry, so
+    # that all downstream linear algebra (and the compiled inner loop)
+    # works on a known dtype/layout
+    kernel = np.ascontiguousarray(kernel, dtype=np.float64)
     N = kernel.shape[0]  # Number of elements
-
-    # Initialization
-    S0, det_S0 = s_init, det_ST(kernel, s_init)
-    chain = [S0]  # Initialize the collection (list) of sample
+    check_s_init(s_init, N)
+
+    if add_delete_core is not None and T_max is None:
+        # Run the compiled inner loop, seeded from rng for reproducibility
+        chain, sizes = add_delete_core(
+            kernel,
+            np.asarray(s_init, dtype=np.int64),
+            nb_iter,
+            rng.randint(2**31 - 1))
+        return [chain[it, :sizes[it]].tolist() for it in range(nb_iter)]
+
+    # Current sample S_arr[:size_S0], stored in a preallocated int array
+    # with a size counter: proposals record the single-element diff and
+    # never copy Python lists of items
+    S_arr = np.empty(N, dtype=np.int64)
+    S_arr[:len(s_init)] = s_init
+    size_S0 = len(s_init)  # Size of the current sample
+    chain = [list(s_init)]  # Initialize the collection (list) of sample
+
+    # Indicator of S0 and position of each item in S0, for O(1) membership
+    # tests and lookups instead of `s in S0` / `S0.index(s)` on a list
+    in_S0 = np.zeros(N, dtype=bool)
+    in_S0[S_arr[:size_S0]] = True
+    pos_in_S0 = np.full(N, -1)
+    pos_in_S0[S_arr[:size_S0]] = np.arange(size_S0)
+
+    # Maintain the lower Cholesky factor chol[:size_S0, :size_S0] of
+    # K_{S0, S0} instead of an explicit inverse: both acceptance ratios
+    # reduce to a single triangular solve in O(|S|^2)
+    # - add t:    det K_{S+t} / det K_S = K_tt - ||z||^2 with L z = K_{S, t}
+    # - delete s: det K_{S-s} / det K_S = (K_S^-1)_ss = ||L^-1 e_s||^2
+    # and the factor itself is maintained in O(|S|^2) by appending the row
+    # [z, sqrt(schur)] (add) or removing a row and re-triangularizing with
+    # Givens rotations (delete). Both updates are backward stable, so no
+    # periodic refactorization is needed, unlike with inverse updates
+    chol = np.zeros((N, N))
+    S0 = S_arr[:size_S0]
+    if size_S0:
+        chol[:size_S0, :size_S0] = la.cholesky(kernel[np.ix_(S0, S0)],
+                                               lower=True)
+
+    # Pre-draw the per-iteration randomness in 3 vectorized calls: cheaper
+    # than 3 scalar RNG calls (and their 1-element array allocations) per
+    # iteration
+    unif_move = rng.rand(nb_iter)  # move with proba 1/2, stay otherwise
+    items = rng.randint(N, size=nb_iter)  # uniform item in [N]
+    unif_accept = rng.rand(nb_iter)  # accept/reject threshold
 
     # Evaluate running time...
     t_start = time.time() if T_max else 0
 
-    for _ in range(1, nb_iter):
+    for it in range(1, nb_iter):
 
         # With proba 1/2 try to add/delete an element
-        if rng.rand() < 0.5:
+        if unif_move[it] < 0.5:
 
             # Perform the potential add/delete move S1 = S0 +/- s
-            S1 = S0.copy()  # S1 = S0
-            s = rng.choice(N)  # Uniform item in [N]
-            if s in S1:
-                S1.remove(s)  # S1 = S0 - s
-            else:
-                S1.append(s)  # S1 = SO + s
+            s = items[it]
+            if in_S0[s]:  # Delete: S1 = S0 - s
+                ind = pos_in_S0[s]
+                # det K_S1 / det K_S0 = (K_S0^-1)_ss, matrix determinant lemma
+                e_s = np.zeros(size_S0)
+                e_s[ind] = 1.0
+                v = la.solve_triangular(chol[:size_S0, :size_S0], e_s,
+                                        lower=True)
+                ratio, z = v.dot(v), None
+            else:  # Add: S1 = S0 + s
+                ind = None
+                # det K_S1 / det K_S0 = Schur complement of K_S0 in K_S1
+                if size_S0:
+                    z = la.solve_triangular(chol[:size_S0, :size_S0],
+                                            kernel[S_arr[:size_S0], s],
+                                            lower=True)
+                    ratio = kernel[s, s] - z.dot(z)
+                else:
+                    z, ratio = None, kernel[s, s]
 
             # Accept_reject the move
-            det_S1 = det_ST(kernel, S1)  # det K_S1
-            if rng.rand() < det_S1 / det_S0:
-                S0, det_S0 = S1, det_S1
-                chain.append(S1)
+            if unif_accept[it] < ratio:
+                if ind is not None:  # S1 = S0 - s, remove at position ind
+                    last = size_S0 - 1
+                    pos_in_S0[S_arr[ind + 1:size_S0]] -= 1
+                    S_arr[ind:last] = S_arr[ind + 1:size_S0]
+                    # Remove row ind of chol; the shifted block is lower
+                    # Hessenberg, chase its superdiagonal down with Givens
+                    # rotations on consecutive columns
+                    chol[ind:last, :size_S0] = chol[ind + 1:size_S0, :size_S0]
+                    for j in range(ind, last):
+                        a, b = chol[j, j], chol[j, j + 1]
+                        r = np.hypot(a, b)
+                        c, sn = a / r, b / r
+                        col_j = chol[j:last, j].copy()
+                        chol[j:last, j] = c * col_j + sn * chol[j:last, j + 1]
+                        chol[j:last, j + 1] = c * chol[j:last, j + 1]\
+                            - sn * col_j
+                        chol[j, j + 1] = 0.0
+                    in_S0[s] = False
+                    pos_in_S0[s] = -1
+                    size_S0 -= 1
+                else:  # S1 = S0 + s, appended last
+                    if z is not None:
+                        chol[size_S0, :size_S0] = z
+                    chol[size_S0, size_S0] = np.sqrt(ratio)
+                    S_arr[size_S0] = s
+                    in_S0[s] = True
+                    pos_in_S0[s] = size_S0
+                    size_S0 += 1
+
+                chain.append(S_arr[:size_S0].tolist())
 
             else:
-                chain.append(S0)
+                chain.append(chain[-1])
 
         else:
-            chain.append(S0)
+            chain.append(chain[-1])
 
         if T_max:
             if time.time() - t_start < T_max:
@@ -366,15 +630,62 @@ def basis_exchange_sampler(kernel, s_init, nb_iter=10, T_max=None,
     rng = check_random_state(random_state)
 
     # Initialization
+    # Store the kernel as a C-contiguous float64 array once at entry, so
+    # that all downstream linear algebra (and the compiled inner loop)
+    # works on a known dtype/layout
+    kernel = np.ascontiguousarray(kernel, dtype=np.float64)
     N = kernel.shape[0]  # Number of elements
-    ground_set = np.arange(N)  # Ground set
+    check_s_init(s_init, N)
+    if len(s_init) == N:
+        # The complement of S0 is empty: an exchange chain of size N has no
+        # valid move, and the rejection draw of t (here and in the compiled
+        # inner loop) would spin forever
+        raise ValueError('Invalid s_init: it contains all the N={} elements of the ground set, the exchange sampler has no valid move.'.format(N))
+
+    if basis_exchange_core is not None and T_max is None:
+        # Run the compiled inner loop, seeded from rng for reproducibility
+        chain = basis_exchange_core(
+            kernel,
+            np.asarray(s_init, dtype=np.int64),
+            nb_iter,
+            rng.randint(2**31 - 1))
+        return chain.tolist()
 
     size = len(s_init)  # Size of the sample (cardinality is fixed)
-    # Initialization
-    S0, det_S0 = s_init, det_ST(kernel, s_init)
+    # Current sample, stored in a preallocated int array, with a scratch
+    # buffer for the intermediate S0 - s: no per-proposal list copies
+    S_arr = np.array(s_init, dtype=np.int64)
+    S_minus = np.empty(size - 1, dtype=np.int64)
 
     chain = np.zeros((nb_iter, size), dtype=int)
-    chain[0] = S0
+    chain[0] = S_arr
+
+    # Indicator of S0, to draw t in [N]-S0 by rejection in O(1) expected
+    # time instead of materializing the whole complement with np.delete
+    in_S0 = np.zeros(N, dtype=bool)
+    in_S0[S_arr] = True
+
+    # Persistent contiguous buffer K_SS = K_{S0, S0}. One row/column is
+    # shifted out (delete s) and appended (add t) per accepted swap, instead
+    # of re-extracting the whole block with kernel[np.ix_(S_arr, S_arr)] at
+    # each refactorization
+    K_SS = np.ascontiguousarray(kernel[np.ix_(S_arr, S_arr)])
+
+    # Maintain K_S0^-1 to compute the acceptance ratio det K_S1 / det K_S0
+    # of a swap move S1 = S0 - s + t as a product of two rank-1 ratios
+    # (delete s, then add t) in O(size^2) instead of a full det in O(size^3)
+    K_S0_inv = la.inv(K_SS)
+
+    # Refactor K_S0^-1 from scratch periodically to tame roundoff drift
+    refactor_period = 100
+    nb_accepted_moves = 0
+
+    # Pre-draw the per-iteration randomness in 3 vectorized calls: cheaper
+    # than 3 scalar RNG calls (and their 1-element array allocations) per
+    # iteration. Only t is still drawn inside the loop, by rejection
+    unif_move = rng.rand(nb_iter)  # swap with proba 1/2, stay otherwise
+    s_inds = rng.randint(size, size=nb_iter)  # uniform index of s in S0
+    unif_accept = rng.rand(nb_iter)  # accept/reject threshold
 
     # Evaluate running time...
     t_start = time.time() if T_max else 0
@@ -382,28 +693,48 @@ def basis_exchange_sampler(kernel, s_init, nb_iter=10, T_max=None,
     for it in range(1, nb_iter):
 
         # With proba 1/2 try to swap 2 elements
-        if rng.rand() < 0.5:
+        if unif_move[it] < 0.5:
 
             # Perform the potential exchange move S1 = S0 - s + t
-            S1 = S0.copy()  # S1 = S0
             # Pick one element s in S0 by index uniformly at random
-            s_ind = rng.choice(size)
-            # Pick one element t in [N]\S0 uniformly at random
-            t = rng.choice(np.delete(ground_set, S0))
-            S1[s_ind] = t  # S_1 = S0 - S0[s_ind] + t
-
-            det_S1 = det_ST(kernel, S1)  # det K_S1
-
-            # Accept_reject the move w. proba
-            if rng.rand() < det_S1 / det_S0:
-                S0, det_S0 = S1, det_S1
-                chain[it] = S1
-
-            else:  # if reject, stay in the same state
-                chain[it] = S0
+            s_ind = s_inds[it]
+            # Pick one element t in [N]\S0 uniformly at random, by rejection
+            t = rng.randint(N)
+            while in_S0[t]:
+                t = rng.randint(N)
+
+            # det K_{S0-s} / det K_S0, matrix determinant lemma
+            ratio_delete = K_S0_inv[s_ind, s_ind]
+            K_Sm_inv = update_inverse_delete(K_S0_inv, s_ind)
+            S_minus[:s_ind] = S_arr[:s_ind]  # S0 - s
+            S_minus[s_ind:] = S_arr[s_ind + 1:]
+            # det K_S1 / det K_{S0-s}, Schur complement
+            schur, w = schur_complement_add(kernel, K_Sm_inv, S_minus, t)
+
+            # Accept_reject the move w. proba det K_S1 / det K_S0
+            if unif_accept[it] < ratio_delete * schur:
+                in_S0[S_arr[s_ind]] = False
+                in_S0[t] = True
+                S_arr[:size - 1] = S_minus  # S1 = S0 - s + t
+                S_arr[size - 1] = t
+                K_S0_inv = update_inverse_add(K_Sm_inv, w, schur)
+
+                # Shift out row/column s_ind, append those of t
+                K_SS[s_ind:size - 1] = K_SS[s_ind + 1:size]
+                K_SS[:, s_ind:size - 1] = K_SS[:, s_ind + 1:size]
+                np.take(kernel[t], S_minus, out=K_SS[size - 1, :size - 1])
+                K_SS[:size - 1, size - 1] = K_SS[size - 1, :size - 1]
+                K_SS[size - 1, size - 1] = kernel[t, t]
+
+                nb_accepted_moves += 1
+                if nb_accepted_moves % refactor_period == 0:
+                    K_S0_inv = la.inv(K_SS)
+
+            # if reject, stay in the same state
+            chain[it] = S_arr
 
         else:
-            chain[it] = S0
+            chain[it] = S_arr
 
         if T_max:
             if time.time() - t_start < T_max:
@@ -423,7 +754,7 @@ def extract_basis(y_sol, eps=1e-5):
     :param y_sol:
         Optimal solution of LP :eq:`eq:Px`
     :type y_sol:
-        list
+        cvxopt.matrix or array_like
 
     :param eps:
         Tolerance :math:`y_i^* \\in (\\epsilon, 1-\\epsilon), \\quad \\epsilon \\geq 0`
@@ -443,9 +774,18 @@ def extract_basis(y_sol, eps=1e-5):
         - :func:`zonotope_sampler <zonotope_sampler>`
     """
 
-    basis = np.where((eps < y_sol) & (y_sol < 1 - eps))[0]
+    if isinstance(y_sol, np.ndarray):
+        y_sol = np.ravel(y_sol)
+    else:
+        try:
+            # CVXOPT matrices store contiguous doubles and expose the buffer
+            # protocol: wrap the memory as a flat view instead of copying it
+            # into a (N, 1) array with np.asarray
+            y_sol = np.frombuffer(y_sol, dtype=np.float64)
+        except TypeError:  # plain sequences have no buffer to wrap
+            y_sol = np.ravel(np.asarray(y_sol))
 
-    return basis
+    return np.flatnonzero((y_sol > eps) & (y_sol < 1 - eps))
 
 
 def zonotope_sampler(A_zono, **params):
@@ -485,12 +825,11 @@ def zonotope_sampler(A_zono, **params):
     """
     # For zonotope sampler
     try:
-        from cvxopt import matrix, spmatrix, solvers
+        from cvxopt import glpk, matrix, spmatrix
     except ImportError:
         raise ValueError('The cvxopt package is required to use the zonotype sampler (see setup.py).')
 
-    solvers.options['show_progress'] = params.get('show_progress', False)
-    solvers.options['glpk'] = {'msg_lev': params.get('show_progress', 'GLP_MSG_OFF')}
+    glpk.options['msg_lev'] = params.get('show_progress', 'GLP_MSG_OFF')
 
     rng = check_random_state(params.get('random_state', None))
 
@@ -512,7 +851,11 @@ def zonotope_sampler(A_zono, **params):
     #        A*x = b                      A*x = b
     #                                      s >= 0
     # CVXOPT
-    # =====> solvers.lp(c, G, h, A, b, solver='glpk')
+    # =====> glpk.lp(c, G, h, A, b)
+    # The problem data (c, G, h, A) persist across iterations, only one
+    # column of A_mM and the right hand side change per MCMC step, so call
+    # the raw GLPK interface directly and skip the per-call argument
+    # validation and option plumbing of the solvers.lp wrapper
     #################################################
 
     # To access the tile Z(B_x)
@@ -536,20 +879,38 @@ def zonotope_sampler(A_zono, **params):
     # Endpoints of segment
     # D_x \cap Z(A) = [x+alpha_m*d, x-alpha_M*d]
     ###########################################################################
-    # alpha_m/_M = argmin  +/-alpha      argmin [+/-1 0^N].T * [alpha,lambda]
-    # s.t.    x + alpha d = A lambda <=> s.t.  [-d A] *[alpha, lambda] = x
-    #         0 <= lambda <= 1             [0^N I_N] *[alpha, lambda] <= [1^N]
-    #                                      [0^N -I_N]                    [0^N]
+    # alpha_M = max alpha    s.t. x + alpha d in Z(A)
+    # alpha_m = min alpha    s.t. x + alpha d in Z(A)
+    # Both endpoints are computed with a single LP: the two feasible regions
+    # are independent copies of {0 <= lambda <= 1, x + alpha d = A lambda},
+    # so maximizing a + b over their product solves both bound problems
+    #
+    # max  a + b    s.t.  A lambda_p - a d = x,  0 <= lambda_p <= 1, a >= 0
+    #                     A lambda_m + b d = x,  0 <= lambda_m <= 1, b >= 0
+    #
+    # with alpha_M = a^* and alpha_m = -b^*, saving one of the three GLPK
+    # solves per MCMC step. Variables ordered as [a, b, lambda_p, lambda_m]
     ##########################################################################
 
-    c_mM = matrix(0.0, (N + 1, 1))
-    c_mM[0] = 1.0
+    c_mM = matrix(0.0, (2 * N + 2, 1))
+    c_mM[0] = -1.0  # glpk.lp minimizes
+    c_mM[1] = -1.0
+
+    A_mM = spmatrix(0.0, [], [], (2 * r, 2 * N + 2))
+    A_mM[:r, 2:N + 2] = A
+    A_mM[r:, N + 2:] = A
 
-    A_mM = spmatrix(0.0, [], [], (r, N + 1))
-    A_mM[:, 1:] = A
+    G_mM = spmatrix(0.0, [], [], (4 * N + 2, 2 * N + 2))
+    G_mM[:2 * N, 2:N + 2] = G
+    G_mM[2 * N:4 * N, N + 2:] = G
+    G_mM[4 * N, 0] = -1.0  # a >= 0
+    G_mM[4 * N + 1, 1] = -1.0  # b >= 0
 
-    G_mM = spmatrix(0.0, [], [], (2 * N, N + 1))
-    G_mM[:, 1:] = G
+    h_mM = matrix(0.0, (4 * N + 2, 1))
+    h_mM[:N] = 1.0
+    h_mM[2 * N:3 * N] = 1.0
+
+    b_mM = matrix(0.0, (2 * r, 1))
 
     # Common h to both kind of LP
     # cf. 0 <= y <= 1 and 0 <= lambda <= 1
@@ -563,16 +924,33 @@ def zonotope_sampler(A_zono, **params):
     while len(B_x0) != r:
         # Initial tile B_x0
         # Solve P_x0(A,c)
-        y_star = solvers.lp(c, G, h, A, x0, solver='glpk')['x']
+        y_star = glpk.lp(c, G, h, A, x0)[1]
         # Get the tile
-        B_x0 = extract_basis(np.asarray(y_star))
+        B_x0 = extract_basis(y_star)
+        if len(B_x0) != r:  # x0 lies on a tile boundary, redraw it
+            x0 = matrix(A_zono.dot(rng.rand(N)))
 
     # Initialize sequence of sample
     chain = np.zeros((nb_iter, r), dtype=int)
     chain[0] = B_x0
 
-    # Compute the det of the tile (Vol(B)=abs(det(B)))
-    det_B_x0 = la.det(A_zono[:, B_x0])
+    # LU factor the current tile basis: Vol(B) = abs(det(B)) is read off the
+    # diagonal of U, and the factorization is kept to be reused across the
+    # iterations where the tile does not change
+    lu_piv_B_x0 = la.lu_factor(A_zono[:, B_x0])
+    det_B_x0 = abs(np.prod(np.diag(lu_piv_B_x0[0])))
+
+    # Binary part of the vertex of tile Z(B_x0): the entries of y^* outside
+    # B_x0 sit at 0/1 and their contribution A_{[N]-B_x0} y^*_{[N]-B_x0} is
+    # constant over the tile, so x in Z(B_x0) iff A_B^{-1}(x - offset) lies
+    # in (0, 1)^r. Optimality of the structure (B_x0, offset) in LP P_x(A,c)
+    # does not depend on x (reduced costs), hence this feasibility test is
+    # enough to identify the tile of x1 without a GLPK solve when the move
+    # stays in the current tile, where it is trivially accepted (ratio = 1)
+    eps = 1e-5
+    y_star_arr = np.frombuffer(y_star, dtype=np.float64)
+    offset_B_x0 = np.asarray(x0).ravel()\
+        - A_zono[:, B_x0].dot(y_star_arr[B_x0])
 
     t_start = time.time() if T_max else 0
 
@@ -582,30 +960,47 @@ def zonotope_sampler(A_zono, **params):
         d = matrix(rng.randn(r, 1))
 
         # Define D_x0 \cap Z(A) = [x0 + alpha_m*d, x0 - alpha_M*d]
-        # Update the constraint [-d A] * [alpha,lambda] = x
-        A_mM[:, 0] = -d
-        # Find alpha_m/M
-        alpha_m = solvers.lp(c_mM, G_mM, h, A_mM, x0, solver='glpk')['x'][0]
-        alpha_M = solvers.lp(-c_mM, G_mM, h, A_mM, x0, solver='glpk')['x'][0]
+        # Update the constraints A lambda_p - a d = x0, A lambda_m + b d = x0
+        A_mM[:r, 0] = -d
+        A_mM[r:, 1] = d
+        b_mM[:r] = x0
+        b_mM[r:] = x0
+        # Find alpha_m/M with a single LP solve
+        alpha_mM = glpk.lp(c_mM, G_mM, h_mM, A_mM, b_mM)[1]
+        alpha_M, alpha_m = alpha_mM[0], -alpha_mM[1]
 
         # Propose x1 ~ U_{[x0+alpha_m*d, x0-alpha_M*d]}
         x1 = x0 + (alpha_m + (alpha_M - alpha_m) * rng.rand()) * d
-        # Proposed tile B_x1
-        # Solve P_x1(A,c)
-        y_star = solvers.lp(c, G, h, A, x1, solver='glpk')['x']
-        # Get the tile
-        B_x1 = extract_basis(np.asarray(y_star))
 
-        # Accept/Reject the move with proba Vol(B1)/Vol(B0)
-        if len(B_x1) != r:  # if extract_basis returned smtg ill conditioned
+        # Short-circuit: when x1 stays in the current tile Z(B_x0) the
+        # tile-identification LP is wasted work, Vol(B1)/Vol(B0) = 1 and
+        # the move is trivially accepted
+        y_B = la.lu_solve(lu_piv_B_x0, np.asarray(x1).ravel() - offset_B_x0)
+        if np.all((y_B > eps) & (y_B < 1 - eps)):
+            x0 = x1
             chain[it] = B_x0
         else:
-            det_B_x1 = la.det(A_zono[:, B_x1])
-            if rng.rand() < abs(det_B_x1 / det_B_x0):
-                x0, B_x0, det_B_x0 = x1, B_x1, det_B_x1
-                chain[it] = B_x1
-            else:
+            # Proposed tile B_x1
+            # Solve P_x1(A,c)
+            y_star = glpk.lp(c, G, h, A, x1)[1]
+            # Get the tile
+            y_star_arr = np.frombuffer(y_star, dtype=np.float64)
+            B_x1 = extract_basis(y_star_arr)
+
+            # Accept/Reject the move with proba Vol(B1)/Vol(B0)
+            if len(B_x1) != r:  # extract_basis returned smtg ill conditioned
                 chain[it] = B_x0
+            else:
+                lu_piv_B_x1 = la.lu_factor(A_zono[:, B_x1])
+                det_B_x1 = abs(np.prod(np.diag(lu_piv_B_x1[0])))
+                if rng.rand() < det_B_x1 / det_B_x0:
+                    x0, B_x0, det_B_x0 = x1, B_x1, det_B_x1
+                    lu_piv_B_x0 = lu_piv_B_x1
+                    offset_B_x0 = np.asarray(x1).ravel()\
+                        - A_zono[:, B_x1].dot(y_star_arr[B_x1])
+                    chain[it] = B_x1
+                else:
+                    chain[it] = B_x0
 
         if T_max:
             if time.time() - t_start < T_max:
@@ -0,0 +1,296 @@
+# coding: utf8
+""" Numba-compiled inner loops for the finite DPP MCMC samplers
+
+- :func:`add_delete_core`
+- :func:`basis_exchange_core`
+
+The hot path of the MCMC samplers is dominated by interpreter overhead:
+per-iteration scalar RNG calls, list operations and tiny NumPy calls.
+Rewriting the loops with explicit scalar code inside ``@njit`` lets numba
+inline the rank-1 determinant updates and the RNG into a single native
+function. This module requires `numba <https://numba.pydata.org/>`_, the
+wrappers in :mod:`dppy.mcmc_sampling` fall back to the pure Python loops
+when it is not installed.
+
+.. seealso:
+
+    `Documentation on ReadTheDocs <https://dppy.readthedocs.io/en/latest/finite_dpps/mcmc_sampling.html>`_
+"""
+
+import numpy as np
+
+from numba import njit
+
+
+@njit(cache=True)
+def add_delete_core(K, s_init, nb_iter, seed):
+    """ Inner loop of :func:`add_delete_sampler <dppy.mcmc_sampling.add_delete_sampler>`.
+
+    :param K:
+        Kernel matrix, C-contiguous float64
+    :type K:
+        array_like
+
+    :param s_init:
+        Initial sample, int64
+    :type s_init:
+        array_like
+
+    :param nb_iter:
+        Number of iterations
+    :type nb_iter:
+        int
+
+    :param seed:
+        Seed of numba's internal random generator
+    :type seed:
+        int
+
+    :return:
+        tuple (chain, sizes): row ``it`` of ``chain`` holds the sample of
+        size ``sizes[it]`` at iteration ``it`` in its first entries
+    :rtype:
+        tuple(array_like, array_like)
+    """
+    np.random.seed(seed)
+
+    N = K.shape[0]
+    size = s_init.size
+
+    # Current sample S[:size], its indicator and the position of each item
+    S = np.empty(N, dtype=np.int64)
+    S[:size] = s_init
+    in_S = np.zeros(N, dtype=np.bool_)
+    pos = np.full(N, -1, dtype=np.int64)
+    for i in range(size):
+        in_S[s_init[i]] = True
+        pos[s_init[i]] = i
+
+    # K_inv[:size, :size] = inverse of K restricted to S[:size]
+    K_inv = np.empty((N, N))
+    if size:
+        K_SS = np.empty((size, size))
+        for i in range(size):
+            for j in range(size):
+                K_SS[i, j] = K[S[i], S[j]]
+        K_inv[:size, :size] = np.linalg.inv(K_SS)
+
+    b = np.empty(N)
+    w = np.empty(N)
+
+    # Refactor K_inv from scratch periodically to tame roundoff drift
+    refactor_period = 100
+    nb_accepted_moves = 0
+
+    chain = np.zeros((nb_iter, N), dtype=np.int64)
+    sizes = np.zeros(nb_iter, dtype=np.int64)
+    chain[0, :size] = S[:size]
+    sizes[0] = size
+
+    for it in range(1, nb_iter):
+
+        # With proba 1/2 try to add/delete an element
+        if np.random.random() < 0.5:
+
+            s = np.random.randint(N)  # Uniform item in [N]
+
+            if in_S[s]:  # Delete: S1 = S0 - s
+                ind = pos[s]
+                # det K_S1 / det K_S0 = (K_S0^-1)_ss
+                ratio = K_inv[ind, ind]
+
+                if np.random.random() < ratio:  # swap-remove at position ind
+                    last = size - 1
+                    if ind != last:
+                        S[ind] = S[last]
+                        pos[S[ind]] = ind
+                        for j in range(size):
+                            K_inv[ind, j], K_inv[last, j] =\
+                                K_inv[last, j], K_inv[ind, j]
+                        for i in range(size):
+                            K_inv[i, ind], K_inv[i, last] =\
+                                K_inv[i, last], K_inv[i, ind]
+                    in_S[s] = False
+                    pos[s] = -1
+                    size = last
+                    # Sherman-Morrison downdate, dropping the last row/column
+                    for i in range(size):
+                        for j in range(size):
+                            K_inv[i, j] -=\
+                                K_inv[i, size] * K_inv[size, j] / ratio
+
+                    nb_accepted_moves += 1
+
+            else:  # Add: S1 = S0 + s
+                # det K_S1 / det K_S0 = Schur complement K_ss - K_sS K_S^-1 K_Ss
+                schur = K[s, s]
+                for i in range(size):
+                    b[i] = K[S[i], s]
+                for i in range(size):
+                    acc = 0.0
+                    for j in range(size):
+                        acc += K_inv[i, j] * b[j]
+                    w[i] = acc
+                    schur -= b[i] * w[i]
+
+                if np.random.random() < schur:
+                    # Block inverse formula, item s appended last
+                    for i in range(size):
+                        for j in range(size):
+                            K_inv[i, j] += w[i] * w[j] / schur
+                    for i in range(size):
+                        K_inv[i, size] = -w[i] / schur
+                        K_inv[size, i] = -w[i] / schur
+                    K_inv[size, size] = 1.0 / schur
+
+                    S[size] = s
+                    pos[s] = size
+                    in_S[s] = True
+                    size += 1
+
+                    nb_accepted_moves += 1
+
+            if nb_accepted_moves == refactor_period:
+                nb_accepted_moves = 0
+                if size:
+                    K_SS = np.empty((size, size))
+                    for i in range(size):
+                        for j in range(size):
+                            K_SS[i, j] = K[S[i], S[j]]
+                    K_inv[:size, :size] = np.linalg.inv(K_SS)
+
+        chain[it, :size] = S[:size]
+        sizes[it] = size
+
+    return chain, sizes
+
+
+@njit(cache=True)
+def basis_exchange_core(K, s_init, nb_iter, seed):
+    """ Inner loop of :func:`basis_exchange_sampler <dppy.mcmc_sampling.basis_exchange_sampler>`.
+
+    :param K:
+        Kernel matrix, C-contiguous float64
+    :type K:
+        array_like
+
+    :param s_init:
+        Initial sample, int64. Must be a strict subset of the ground set:
+        the wrapper raises on ``len(s_init) == K.shape[0]``, for which the
+        rejection draw of t below would never terminate
+    :type s_init:
+        array_like
+
+    :param nb_iter:
+        Number of iterations
+    :type nb_iter:
+        int
+
+    :param seed:
+        Seed of numba's internal random generator
+    :type seed:
+        int
+
+    :return:
+        MCMC chain of approximate samples (stacked row_wise i.e. nb_iter rows)
+    :rtype:
+        array_like
+    """
+    np.random.seed(seed)
+
+    N = K.shape[0]
+    size = s_init.size
+
+    S = np.empty(size, dtype=np.int64)
+    S[:] = s_init
+    in_S = np.zeros(N, dtype=np.bool_)
+    for i in range(size):
+        in_S[s_init[i]] = True
+
+    # Inverse of K restricted to S, maintained by rank-1 updates
+    K_SS = np.empty((size, size))
+    for i in range(size):
+        for j in range(size):
+            K_SS[i, j] = K[S[i], S[j]]
+    K_inv = np.linalg.inv(K_SS)
+
+    K_m_inv = np.empty((size, size))  # inverse of K restricted to S - s
+    b = np.empty(size)
+    w = np.empty(size)
+
+    # Refactor K_inv from scratch periodically to tame roundoff drift
+    refactor_period = 100
+    nb_accepted_moves = 0
+
+    chain = np.zeros((nb_iter, size), dtype=np.int64)
+    chain[0] = S
+
+    for it in range(1, nb_iter):
+
+        # With proba 1/2 try to swap 2 elements
+        if np.random.random() < 0.5:
+
+            # Pick one element s in S by index uniformly at random
+            s_ind = np.random.randint(size)
+            # Pick one element t in [N]\S uniformly at random, by rejection
+            t = np.random.randint(N)
+            while in_S[t]:
+                t = np.random.randint(N)
+
+            # det K_{S-s} / det K_S
+            ratio_delete = K_inv[s_ind, s_ind]
+
+            # Sherman-Morrison downdate of the inverse, dropping s
+            m = size - 1
+            for i in range(size):
+                if i == s_ind:
+                    continue
+                i_m = i if i < s_ind else i - 1
+                for j in range(size):
+                    if j == s_ind:
+                        continue
+                    j_m = j if j < s_ind else j - 1
+                    K_m_inv[i_m, j_m] = K_inv[i, j]\
+                        - K_inv[i, s_ind] * K_inv[s_ind, j] / ratio_delete
+
+            # det K_{S-s+t} / det K_{S-s} = Schur complement
+            schur = K[t, t]
+            for i in range(size):
+                if i == s_ind:
+                    continue
+                i_m = i if i < s_ind else i - 1
+                b[i_m] = K[S[i], t]
+            for i in range(m):
+                acc = 0.0
+                for j in range(m):
+                    acc += K_m_inv[i, j] * b[j]
+                w[i] = acc
+                schur -= b[i] * w[i]
+
+            # Accept_reject the move w. proba det K_S1 / det K_S0
+            if np.random.random() < ratio_delete * schur:
+                in_S[S[s_ind]] = False
+                in_S[t] = True
+                for i in range(s_ind, m):
+                    S[i] = S[i + 1]
+                S[m] = t
+
+                # Block inverse formula, item t appended last
+                for i in range(m):
+                    for j in range(m):
+                        K_inv[i, j] = K_m_inv[i, j] + w[i] * w[j] / schur
+                for i in range(m):
+                    K_inv[i, m] = -w[i] / schur
+                    K_inv[m, i] = -w[i] / schur
+                K_inv[m, m] = 1.0 / schur
+
+                nb_accepted_moves += 1
+                if nb_accepted_moves % refactor_period == 0:
+                    for i in range(size):
+                        for j in range(size):
+                            K_SS[i, j] = K[S[i], S[j]]
+                    K_inv[:, :] = np.linalg.inv(K_SS)
+
+        chain[it] = S
+
+    return chain
@@ -1,6 +1,7 @@
 from string import ascii_lowercase
 import numpy as np
 from numpy.linalg import det, matrix_rank
+from scipy.linalg.lapack import dpotrf
 
 
 def check_random_state(seed: object) -> np.random.RandomState:
@@ -105,6 +106,43 @@ def det_ST(array, S, T=None):
         return det(array[np.ix_(S, T)])
 
 
+def logdet_ST(array, S):
+    """ Compute :math:`\\log \\det M_{S, S} = \\log \\det [M_{ij}]_{i\\inS, j\\in S}` via Cholesky factorization.
+
+    Cholesky (LAPACK ``dpotrf``) requires ~2x fewer flops than the LU
+    factorization behind :func:`det_ST <det_ST>` and working in log scale
+    avoids over/underflow of the determinant for larger :math:`|S|`.
+    ``dpotrf`` is called directly: when a pivot turns non-positive it aborts
+    the factorization early and reports ``info > 0``, in which case
+    :math:`\\det M_{S, S} \\leq 0` and :math:`-\\infty` is returned, i.e.
+    certain rejection for the MCMC samplers working in log scale.
+
+    :param array:
+        Matrix, assumed symmetric positive definite on :math:`S`
+    :type array:
+        array_like
+
+    :param S:
+        collection of indices
+    :type S:
+        1D list, array_like
+
+    :return:
+        :math:`\\log \\det M_{S, S}` and :math:`-\\infty` when :math:`M_{S, S}` is not positive definite. If S=[], numpy convention = 0.0
+    :rtype:
+        float
+    """
+
+    if not len(S):
+        return 0.0
+
+    chol, info = dpotrf(array[np.ix_(S, S)], lower=True)
+    if info > 0:  # leading minor of order `info` is not positive definite
+        return -np.inf
+
+    return 2.0 * np.sum(np.log(np.diag(chol)))
+
+
 def is_square(array):
 
     if array is None:
@@ -100,10 +100,12 @@ setup(
     # $ pip install -e .[dev,test]
     # zonotope: To play with the zonotope MCMC sampler
     # trees: To play with uniform spanning trees
+    # mcmc: To compile the inner loops of the finite DPP MCMC samplers
     # docs: Documentation bibligraphy and theme theme
     extras_require={
         'zonotope': ['cvxopt==1.2.1'],
         'trees': ['networkx'],
+        'mcmc': ['numba'],
         'docs': ['sphinxcontrib-bibtex', 'sphinx_rtd_theme']
         }
 
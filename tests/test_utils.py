@@ -81,6 +81,34 @@ class TestUtils(unittest.TestCase):
                                         np.allclose(utils.det_ST(arr, S, T),
                                                     la.det(arr[np.ix_(S, T)])))
 
+    def test_logdet_ST(self):
+        """Test log determinant
+            - logdet_ST(arr, S) = log det(arr[S, S]) for arr[S, S] SPD
+            - logdet_ST(arr, S) = -inf for arr[S, S] not positive definite
+        """
+
+        shapes = [10, 50, 100, 300]
+        nb_minors = 10
+
+        for sh in shapes:
+            with self.subTest(axis=sh):
+
+                X = rndm.rand(sh, sh)
+                arr = X.dot(X.T) + np.eye(sh)
+                size_minors = sh // 3
+
+                for idx in range(nb_minors):
+                    with self.subTest(idx=idx):
+
+                        S = rndm.choice(sh, size=size_minors, replace=False)
+
+                        self.assertTrue(
+                            np.allclose(utils.logdet_ST(arr, S),
+                                        np.log(la.det(arr[np.ix_(S, S)]))))
+
+        not_pd = np.array([[1.0, 2.0], [2.0, 1.0]])
+        self.assertEqual(utils.logdet_ST(not_pd, [0, 1]), -np.inf)
+
     def test_symmetric(self):
 
         N = 20